@@ -0,0 +1,120 @@
+"""Thin async client for the Ecoinvent release API.
+
+`ecoinvent_interface` uses blocking `requests` under the hood, which would
+serialize concurrent calls to the release listing endpoints on network
+latency. This module talks to the same REST endpoints directly through a
+shared `httpx.AsyncClient`. The actual release downloads and imports still
+go through `ecoinvent_interface`.
+"""
+
+import time
+
+import httpx
+from ecoinvent_interface.core import SYSTEM_MODELS
+
+SSO_URL = "https://sso.ecoinvent.org/realms/ecoinvent/protocol/openid-connect/token"
+API_URL = "https://api.ecoquery.ecoinvent.org"
+
+# The release catalogue changes a few times per year, so an hour of staleness
+# is harmless and saves two HTTP round trips per listing request.
+RELEASES_TTL = 3600.0
+
+# username -> (fetched_at, releases). Expired entries are kept so they can be
+# served stale if Ecoinvent is unreachable.
+_releases_cache: dict[str, tuple[float, list[dict]]] = {}
+
+
+async def get_token(client: httpx.AsyncClient, username: str, password: str) -> str:
+    """
+    Fetch an access token for the Ecoinvent API.
+
+    Args:
+        client (httpx.AsyncClient): The shared HTTP client.
+        username (str): The Ecoinvent username.
+        password (str): The Ecoinvent password.
+
+    Returns:
+        str: The bearer token to use against the API.
+
+    Raises:
+        httpx.HTTPStatusError: If the credentials are rejected.
+    """
+    response = await client.post(
+        SSO_URL,
+        data={
+            "username": username,
+            "password": password,
+            "client_id": "apollo-ui",
+            "grant_type": "password",
+        },
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def get_releases(
+    client: httpx.AsyncClient, username: str, password: str
+) -> list[dict]:
+    """
+    Fetch the raw list of releases visible to the given account.
+
+    The `/files` endpoint returns a top-level JSON list of version objects,
+    each with a `version_name` and a `releases` list whose entries carry a
+    `system_model_name` (the same shape `ecoinvent_interface` iterates).
+
+    Results are cached per username for RELEASES_TTL seconds. If the fetch
+    fails and a stale entry exists, the stale entry is returned instead
+    (except on 401, where the caller needs to see the credential problem).
+    """
+    cached = _releases_cache.get(username)
+    if cached is not None and time.monotonic() - cached[0] < RELEASES_TTL:
+        return cached[1]
+    try:
+        token = await get_token(client, username, password)
+        response = await client.get(
+            f"{API_URL}/files", headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        releases = response.json()
+    except httpx.HTTPStatusError as e:
+        if cached is not None and e.response.status_code != 401:
+            return cached[1]
+        raise
+    except httpx.HTTPError:
+        if cached is not None:
+            return cached[1]
+        raise
+    _releases_cache[username] = (time.monotonic(), releases)
+    return releases
+
+
+async def list_versions(
+    client: httpx.AsyncClient, username: str, password: str
+) -> list[str]:
+    """Return the available release version names, e.g. ["3.9.1", "3.10"]."""
+    releases = await get_releases(client, username, password)
+    return [release["version_name"] for release in releases]
+
+
+async def list_system_models(
+    client: httpx.AsyncClient, username: str, password: str, version: str
+) -> list[str] | None:
+    """
+    Return the system model names for one release version.
+
+    Names are translated to the short forms `ecoinvent_interface` uses
+    ("Allocation cut-off by classification" -> "cutoff", etc.), since those
+    are what clients and the import endpoint work with. Returns None if the
+    version does not exist for this account, so the caller can turn that
+    into a 404.
+    """
+    releases = await get_releases(client, username, password)
+    for release in releases:
+        if release["version_name"] == version:
+            return [
+                SYSTEM_MODELS.get(
+                    obj["system_model_name"], obj["system_model_name"]
+                )
+                for obj in release["releases"]
+            ]
+    return None
@@ -1,18 +1,279 @@
-from fastapi import FastAPI, HTTPException
-import requests
+import asyncio
+import functools
+import hashlib
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+
+import anyio.to_thread
+import httpx
+import numpy as np
+from scipy.sparse.linalg import factorized
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 import bw2data as bd
+from bw2data.backends import ActivityDataset, sqlite3_lci_db
 import bw2calc as bc
 import bw2io as bi
 from ecoinvent_interface import (
     Settings,
-    EcoinventRelease,
     permanent_setting,
 )
+import ecoinvent_api
 from models import Credentials, EcoinventImportDetails, LCARequest, LCAResult, LCAInput
 from utils import convert_results_format
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+# Shared async HTTP client for the Ecoinvent release API, created in lifespan.
+http_client: httpx.AsyncClient = None
+
+# Pool for CPU-bound LCA solves, created in lifespan. Each demand is an
+# independent solve, so they parallelize across worker processes.
+process_pool: ProcessPoolExecutor = None
+
+# Single-worker pool for ecoinvent imports, created in lifespan. Imports
+# write into the process-global project state for minutes, so they run in
+# a process that serves no requests instead of a threadpool thread.
+import_pool: ProcessPoolExecutor = None
+
+# Demands per pool task: large enough to amortize task overhead, small
+# enough that a big request still spreads across workers.
+_LCA_CHUNK_SIZE = 8
+
+# Workers fork lazily on first submit under the default start method, so
+# they would inherit a snapshot of the project guard (a reader counted at
+# fork time never drains in the child, deadlocking later solves) and of
+# bw2data's loaded metadata. spawn starts workers from a clean interpreter.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The endpoints below are plain ``def`` because bw2data/bw2calc/bw2io and
+    # the Ecoinvent API calls are all blocking; FastAPI runs them in the
+    # threadpool. Raise the default limit (40) so a long-running import
+    # doesn't starve the quick lookup endpoints.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+    global http_client, process_pool, import_pool
+    http_client = httpx.AsyncClient(timeout=30.0)
+    process_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=_MP_CONTEXT
+    )
+    import_pool = ProcessPoolExecutor(max_workers=1, mp_context=_MP_CONTEXT)
+    yield
+    import_pool.shutdown()
+    process_pool.shutdown()
+    await http_client.aclose()
+
+
+# orjson is much faster than stdlib json for the nested dicts the LCA
+# endpoints return. Scores are cast to plain float before they get here.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# (project, database, code) -> activity object. Activities are immutable
+# between imports, so a short TTL is plenty. TTLCache is not thread-safe
+# and the threadpool hits it concurrently, hence the lock.
+_activity_cache = TTLCache(maxsize=10_000, ttl=300)
+_activity_cache_lock = threading.Lock()
+
+# Read-friendly SQLite settings for the threadpool's concurrent readers:
+# WAL so readers never block behind a writer, a 64 MB page cache, and
+# mmap'd reads. Applied to every new connection peewee opens.
+_SQLITE_PRAGMAS = (
+    ("journal_mode", "wal"),
+    ("synchronous", "normal"),
+    ("cache_size", -64000),
+    ("mmap_size", 268435456),
+)
+
+
+def _tune_sqlite() -> None:
+    """Apply the pragmas above to the active project's LCI database.
+
+    peewee already keeps one connection per thread, so there is no need for
+    a hand-rolled pool; marking the pragmas permanent makes peewee replay
+    them on each connection it opens. bw2data swaps in a fresh database
+    object on every project switch, hence the marker attribute.
+    """
+    db = sqlite3_lci_db.db
+    if getattr(db, "_pragmas_tuned", False):
+        return
+    for name, value in _SQLITE_PRAGMAS:
+        db.pragma(name, value, permanent=True)
+    db._pragmas_tuned = True
+
+
+class _ProjectGuard:
+    """Readers-writer guard around bw2data's process-global project state.
+
+    bd.projects.set_current swaps SQLite connections and metadata for the
+    whole process, so a request must not only switch projects safely but
+    also keep its project active for every read it makes. Requests for the
+    currently active project share access (and re-entry from the same
+    request is fine); switching projects waits until no reader is left, and
+    exclusive access additionally keeps everyone else out for its duration.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._exclusive = False
+
+    @contextmanager
+    def use(self, project_name: str):
+        """Hold shared access with project_name active for the block."""
+        with self._cond:
+            while self._exclusive or (
+                self._readers > 0 and bd.projects.current != project_name
+            ):
+                self._cond.wait()
+            if bd.projects.current != project_name:
+                bd.projects.set_current(project_name)
+            _tune_sqlite()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self, project_name: str):
+        """Hold exclusive access with project_name active for the block."""
+        with self._cond:
+            while self._exclusive or self._readers > 0:
+                self._cond.wait()
+            self._exclusive = True
+            if bd.projects.current != project_name:
+                bd.projects.set_current(project_name)
+            _tune_sqlite()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+
+_project_guard = _ProjectGuard()
+project_use = _project_guard.use
+project_exclusive = _project_guard.exclusive
+
+
+# project -> {lcia_method name: [full method tuples]}, built lazily.
+_methods_index: dict = {}
+_methods_index_lock = threading.Lock()
+
+# project -> set of all method tuples, derived from the index above.
+_methods_sets: dict = {}
+
+
+def _get_methods_index(project_name: str) -> dict:
+    """Return the {lcia_method: [method tuples]} index for a project.
+
+    Iterating bd.methods touches thousands of SQLite-backed entries, and
+    three endpoints need (parts of) the same listing, so it is built once
+    per project and dropped after an ecoinvent import. Callers must hold
+    project_use(project_name).
+    """
+    index = _methods_index.get(project_name)
+    if index is not None:
+        return index
+    with _methods_index_lock:
+        index = _methods_index.get(project_name)
+        if index is None:
+            index = {}
+            for method in bd.methods:
+                index.setdefault(method[0], []).append(tuple(method))
+            _methods_index[project_name] = index
+        return index
+
+
+def _get_methods_set(project_name: str) -> set:
+    """Return the set of all method tuples for a project.
+
+    Validating client-supplied impact categories is then a hashed lookup
+    per category instead of a membership test against bd.methods.
+    """
+    methods_set = _methods_sets.get(project_name)
+    if methods_set is None:
+        index = _get_methods_index(project_name)
+        methods_set = {
+            method for methods in index.values() for method in methods
+        }
+        _methods_sets[project_name] = methods_set
+    return methods_set
+
+
+@functools.lru_cache(maxsize=32)
+def _get_db(project_name: str, database_name: str):
+    """Return a Database handle for a project.
+
+    `bd.Database(...)` re-reads metadata every time, so handles are memoized
+    per (project, database). The cache is cleared after an ecoinvent import.
+    Callers must hold project_use(project_name).
+    """
+    return bd.Database(database_name)
+
+
+def _get_activity(project_name: str, database_name: str, code: str):
+    """Fetch an activity by code, going through the TTL cache.
+
+    Raises KeyError if the code does not exist, like `db.get`. Callers must
+    hold project_use(project_name).
+    """
+    key = (project_name, database_name, code)
+    with _activity_cache_lock:
+        try:
+            return _activity_cache[key]
+        except KeyError:
+            pass
+    activity = _get_db(project_name, database_name).get(code)
+    with _activity_cache_lock:
+        _activity_cache[key] = activity
+    return activity
+
+
+# Per-project data version, bumped whenever something changes the project
+# (imports, and for the "" key, project creation). Feeds the ETags below.
+_project_versions: defaultdict = defaultdict(int)
+
+
+def _etag_headers(payload, max_age: int = 3600) -> dict:
+    """Build ETag and Cache-Control headers for a cacheable payload."""
+    etag = hashlib.md5(repr(payload).encode()).hexdigest()
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+
+def _project_etag_headers(project_name: str, *parts: str) -> dict:
+    """Build ETag and Cache-Control headers tied to a project's data version.
+
+    Project data only changes on imports, so list endpoints can share one
+    version counter per project. Extra parts distinguish sub-resources.
+    """
+    version = _project_versions[project_name]
+    tag = ":".join((project_name, *parts, str(version)))
+    etag = hashlib.md5(tag.encode()).hexdigest()
+    return {"ETag": etag, "Cache-Control": "private, max-age=60"}
+
+
+def _not_modified(request: Request, response: Response, headers: dict):
+    """Apply cache headers; return a 304 if the client's ETag still matches."""
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
 
 # You would want to add this if you are making a front end
 # app.add_middleware(
@@ -24,7 +285,7 @@ app = FastAPI()
 # )
 
 @app.post("/api/v1/projects/")
-async def create_project(project_name: str):
+def create_project(project_name: str):
     """
     Create a new project.
 
@@ -43,11 +304,13 @@ async def create_project(project_name: str):
     if project_name in bd.projects:
         raise HTTPException(status_code=400, detail="Project already exists.")
     bd.projects.create_project(project_name)
+    # The "" key versions the project list itself.
+    _project_versions[""] += 1
     return {"project": project_name}
 
 
 @app.post("/api/v1/set_ecoinvent_credentials/")
-async def set_ecoinvent_credentials(credentials: Credentials):
+def set_ecoinvent_credentials(credentials: Credentials):
     """
     Sets the Ecoinvent credentials for a user.
 
@@ -66,10 +329,13 @@ async def set_ecoinvent_credentials(credentials: Credentials):
 
 
 @app.get("/api/v1/release/versions")
-async def list_release_versions():
+async def list_release_versions(request: Request, response: Response):
     """
     Retrieve the list of available Ecoinvent release versions.
 
+    The release catalogue is cached server-side for an hour, and responses
+    carry an ETag so clients can revalidate with If-None-Match and get a 304.
+
     Returns:
         dict: A dictionary containing the list of release versions.
 
@@ -81,10 +347,15 @@ async def list_release_versions():
     """
     my_settings = Settings()
     try:
-        release = EcoinventRelease(my_settings)
-        versions = release.list_versions()
+        versions = await ecoinvent_api.list_versions(
+            http_client, my_settings.username, my_settings.password
+        )
+        headers = _etag_headers(versions)
+        not_modified = _not_modified(request, response, headers)
+        if not_modified is not None:
+            return not_modified
         return {"versions": versions}
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
             raise HTTPException(
                 status_code=401,
@@ -97,10 +368,12 @@ async def list_release_versions():
 
 
 @app.get("/api/v1/release/versions/{version}/system_models")
-async def list_system_models(version):
+async def list_system_models(version, request: Request, response: Response):
     """
     Retrieve the list of system models.
 
+    Cached and conditional-GET friendly in the same way as /release/versions.
+
     Returns:
         dict: A dictionary containing the list of system models.
 
@@ -109,28 +382,101 @@ async def list_system_models(version):
     """
     my_settings = Settings()
     try:
-        release = EcoinventRelease(my_settings)
-        return {"system_models": release.list_system_models(version)}
-    except requests.exceptions.HTTPError as e:
+        system_models = await ecoinvent_api.list_system_models(
+            http_client, my_settings.username, my_settings.password, version
+        )
+        if system_models is None:
+            raise HTTPException(status_code=404, detail="Version not found.")
+        headers = _etag_headers(system_models)
+        not_modified = _not_modified(request, response, headers)
+        if not_modified is not None:
+            return not_modified
+        return {"system_models": system_models}
+    except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
             raise HTTPException(status_code=401, detail="Unauthorized")
         else:
             raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
-@app.post("/api/v1/project/{project_name}/import_ecoinvent/")
-async def import_ecoinvent(project_name: str, import_details: EcoinventImportDetails):
+# job id -> {"project", "version", "system_model", "status", "error"?}.
+_import_jobs: dict = {}
+
+
+def _import_worker(project_name: str, version: str, system_model: str) -> None:
+    """Run one ecoinvent import. Runs inside the dedicated import process.
+
+    The import writes into the process-global project state for minutes;
+    isolating it in its own process means it can never write into a project
+    a concurrent request switched to, and requests keep being served.
+    """
+    with project_exclusive(project_name):
+        bi.import_ecoinvent_release(version=version, system_model=system_model)
+
+
+def _run_import(
+    job_id: str, project_name: str, version: str, system_model: str
+) -> None:
+    """Background task driving an ecoinvent import job to completion."""
+    try:
+        if import_pool is not None:
+            import_pool.submit(
+                _import_worker, project_name, version, system_model
+            ).result()
+        else:
+            _import_worker(project_name, version, system_model)
+    except Exception as e:
+        _import_jobs[job_id].update(status="failed", error=str(e))
+        return
+    # The import ran in its own process, so this process still holds the
+    # bd.databases/bd.methods it loaded before the import. set_current
+    # re-reads the metadata files even when the project is already
+    # current, so a round trip under exclusive access picks up the new
+    # database.
+    with project_exclusive(project_name):
+        bd.projects.set_current(project_name)
+        _tune_sqlite()
+    # The import added a database, so cached handles, activities, prepared
+    # LCA objects, and the methods index are stale.
+    _get_db.cache_clear()
+    with _activity_cache_lock:
+        _activity_cache.clear()
+    _lca_cache.clear()
+    _methods_index.pop(project_name, None)
+    _methods_sets.pop(project_name, None)
+    _project_versions[project_name] += 1
+    # Long-lived pool workers keep their own pre-import metadata and never
+    # see the reload above, so swap in a fresh pool; in-flight tasks on
+    # the old one finish before it winds down.
+    global process_pool
+    if process_pool is not None:
+        old_pool = process_pool
+        process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=_MP_CONTEXT
+        )
+        old_pool.shutdown(wait=False)
+    _import_jobs[job_id].update(status="done")
+
+
+@app.post("/api/v1/project/{project_name}/import_ecoinvent/", status_code=202)
+async def import_ecoinvent(
+    project_name: str,
+    import_details: EcoinventImportDetails,
+    background_tasks: BackgroundTasks,
+):
     """
     Import an Ecoinvent release into a project.
 
-    If it seems like its taking too long, its because it does take a long time to import the data.
+    The import takes a long time, so it runs as a background job: the
+    response is a 202 with a job id, and progress can be checked at
+    /api/v1/import_jobs/{job_id}.
 
     Args:
         project_name (str): The name of the project to import the release into.
         import_details (EcoinventImportDetails): The details of the Ecoinvent release to import, including version and system model.
 
     Returns:
-        dict: A dictionary containing the name of the project and the version of the release imported.
+        dict: A dictionary containing the job id and the job details.
 
     Raises:
         HTTPException: If the version or system model is not found.
@@ -138,29 +484,63 @@ async def import_ecoinvent(project_name: str, import_details: EcoinventImportDet
     Example:
         curl -X POST "http://localhost:8000/api/v1/project/my_project/import_ecoinvent/" -H "Content-Type: application/json" -d '{"version": "3.7.1", "system_model": "consequential"}'
     """
-    bd.projects.set_current(project_name)
     my_settings = Settings()
-    release = EcoinventRelease(my_settings)
-    if import_details.version not in release.list_versions():
+    # Validate against the TTL-cached release listings, so a warm cache
+    # means no network round trips before the job is accepted.
+    versions = await ecoinvent_api.list_versions(
+        http_client, my_settings.username, my_settings.password
+    )
+    if import_details.version not in versions:
         raise HTTPException(status_code=404, detail="Version not found.")
-    if import_details.system_model not in release.list_system_models(
-        import_details.version
-    ):
-        raise HTTPException(status_code=404, detail="System model not found.")
-
-    bi.import_ecoinvent_release(
-        version=import_details.version, system_model=import_details.system_model
+    system_models = await ecoinvent_api.list_system_models(
+        http_client, my_settings.username, my_settings.password, import_details.version
     )
+    if system_models is None or import_details.system_model not in system_models:
+        raise HTTPException(status_code=404, detail="System model not found.")
 
-    return {
+    job_id = uuid.uuid4().hex
+    _import_jobs[job_id] = {
         "project": project_name,
         "version": import_details.version,
         "system_model": import_details.system_model,
+        "status": "running",
     }
+    background_tasks.add_task(
+        _run_import,
+        job_id,
+        project_name,
+        import_details.version,
+        import_details.system_model,
+    )
+    return {"job_id": job_id, **_import_jobs[job_id]}
+
+
+@app.get("/api/v1/import_jobs/{job_id}")
+def get_import_job(job_id: str):
+    """
+    Retrieve the status of an ecoinvent import job.
+
+    Args:
+        job_id (str): The job id returned by the import endpoint.
+
+    Returns:
+        dict: The job details, including a status of "running", "done", or
+        "failed" (with an error message).
+
+    Raises:
+        HTTPException: If the job id is not known.
+
+    Example:
+        curl "http://localhost:8000/api/v1/import_jobs/{job_id}"
+    """
+    job = _import_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
 
 
 @app.get("/api/v1/projects/")
-async def list_projects():
+def list_projects(request: Request, response: Response):
     """
     Retrieves a list of projects.
 
@@ -170,13 +550,17 @@ async def list_projects():
     Example:
        curl "http://localhost:8000/api/version_number(v1)/projects"
     """
+    headers = _project_etag_headers("")
+    not_modified = _not_modified(request, response, headers)
+    if not_modified is not None:
+        return not_modified
     projects_list = list(bd.projects)
     clean_projects_list = [project.name for project in projects_list]
     return {"projects": clean_projects_list}
 
 
 @app.get("/api/v1/project/{project_name}/databases")
-async def list_project_databases(project_name: str):
+def list_project_databases(project_name: str, request: Request, response: Response):
     """
     Retrieve the list of databases for a given project.
 
@@ -193,15 +577,20 @@ async def list_project_databases(project_name: str):
         curl "http://localhost:8000/api/version_number(v1)/projects/my_project/database"
     """
     if project_name in bd.projects:
-        if bd.projects.current != project_name:
-            bd.projects.set_current(project_name)
-        return {"databases": list(bd.databases)}
+        headers = _project_etag_headers(project_name, "databases")
+        not_modified = _not_modified(request, response, headers)
+        if not_modified is not None:
+            return not_modified
+        with project_use(project_name):
+            return {"databases": list(bd.databases)}
     else:
         raise HTTPException(status_code=404, detail="Project not found.")
 
 
 @app.get("/api/v1/project/{project_name}/database/{database_name}/activity/search")
-async def search_activities(project_name: str, database_name: str, search_term: str):
+def search_activities(
+    project_name: str, database_name: str, search_term: str, limit: int = 25
+):
     """
     Search for activities in a specific project and database based on a given search term.
 
@@ -209,19 +598,12 @@ async def search_activities(project_name: str, database_name: str, search_term:
         project_name (str): The name of the project.
         database_name (str): The name of the database.
         search_term (str): The search term to match against activity names.
+        limit (int): The maximum number of results to return. Defaults to 25.
 
     Returns:
-        dict: A dictionary containing the search results in the following format:
-            {
-                "results": [
-                    {
-                        "code": <activity_code>,
-                        "name": <activity_name>
-                        "location": <activity_location>,
-                    },
-                    ...
-                ]
-            }
+        StreamingResponse: Newline-delimited JSON (application/x-ndjson),
+            one object per line, streamed as results are found:
+                {"code": <activity_code>, "name": <activity_name>, "location": <activity_location>}
 
     Raises:
         HTTPException: If the specified project is not found.
@@ -236,27 +618,35 @@ async def search_activities(project_name: str, database_name: str, search_term:
     """
     if project_name not in bd.projects:
         raise HTTPException(status_code=404, detail="Project not found.")
-    if bd.projects.current != project_name:
-        bd.projects.set_current(project_name)
-    if database_name not in bd.databases:
-        raise HTTPException(status_code=404, detail="Database not found.")
-    db = bd.Database(database_name)
-    results = db.search(search_term)
-    formatted_results = [
-        {
-            "code": activity["code"],
-            "name": activity["name"],
-            "location": activity["location"],
-        }
-        for activity in results
-    ]
-    return {"results": formatted_results}
+    with project_use(project_name):
+        if database_name not in bd.databases:
+            raise HTTPException(status_code=404, detail="Database not found.")
+        db = _get_db(project_name, database_name)
+        # Run the search inside the handler, under the project guard: the
+        # streamed generator executes after the handler returns, where a
+        # search would race project switches and an error could only
+        # truncate an already-started 200. With the bounded limit the hit
+        # list is small; only the serialization is streamed.
+        rows = [
+            {
+                "code": activity["code"],
+                "name": activity["name"],
+                "location": activity["location"],
+            }
+            for activity in db.search(search_term, limit=limit)
+        ]
+
+    def generate():
+        for row in rows:
+            yield orjson.dumps(row) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @app.get(
     "/api/v1/projects/{project_name}/database/{database_name}/activity/{activity_code}"
 )
-async def get_activity_by_code(
+def get_activity_by_code(
     project_name: str, database_name: str, activity_code: str
 ):
     """
@@ -278,23 +668,21 @@ async def get_activity_by_code(
     """
     if project_name not in bd.projects:
         raise HTTPException(status_code=404, detail="Project not found.")
-    if bd.projects.current != project_name:
-        bd.projects.set_current(project_name)
-    if database_name not in bd.databases:
-        raise HTTPException(status_code=404, detail="Database not found.")
-    db = bd.Database(database_name)
-    try:
-        activity = db.get(activity_code)
-        activity_data = {"code": activity["code"], "name": activity["name"]}
-        return {"activity": activity_data}
-    except KeyError:
-        raise HTTPException(status_code=404, detail="Activity not found.")
+    with project_use(project_name):
+        if database_name not in bd.databases:
+            raise HTTPException(status_code=404, detail="Database not found.")
+        try:
+            activity = _get_activity(project_name, database_name, activity_code)
+            activity_data = {"code": activity["code"], "name": activity["name"]}
+            return {"activity": activity_data}
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Activity not found.")
 
 
 @app.get(
     "/api/v1/project/{project_name}/database/{database_name}/activity/{activity_code}/exchanges"
 )
-async def get_activity_exchanges(
+def get_activity_exchanges(
     project_name: str, database_name: str, activity_code: str
 ):
     """
@@ -316,29 +704,27 @@ async def get_activity_exchanges(
     """
     if project_name not in bd.projects:
         raise HTTPException(status_code=404, detail="Project not found.")
-    if bd.projects.current != project_name:
-        bd.projects.set_current(project_name)
-    if database_name not in bd.databases:
-        raise HTTPException(status_code=404, detail="Database not found.")
-    db = bd.Database(database_name)
-    try:
-        activity = db.get(activity_code)
-        exchanges = [
-            {
-                "input": exchange.input,
-                "amount": exchange["amount"],
-                "type": exchange["type"],
-            }
-            for exchange in activity.exchanges()
-        ]
-        print(activity)
-        return {"exchanges": exchanges}
-    except KeyError:
-        raise HTTPException(status_code=404, detail="Activity not found.")
+    with project_use(project_name):
+        if database_name not in bd.databases:
+            raise HTTPException(status_code=404, detail="Database not found.")
+        try:
+            activity = _get_activity(project_name, database_name, activity_code)
+            exchanges = [
+                {
+                    "input": exchange.input,
+                    "amount": exchange["amount"],
+                    "type": exchange["type"],
+                }
+                for exchange in activity.exchanges()
+            ]
+            logger.debug("Fetched exchanges for activity %s", activity_code)
+            return {"exchanges": exchanges}
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Activity not found.")
 
 
 @app.get("/api/v1/project/{project_name}/lcia_methods")
-async def get_lcia_methods(project_name: str):
+def get_lcia_methods(project_name: str, request: Request, response: Response):
     """
     Retrieve the list of methods in a project.
 
@@ -356,15 +742,19 @@ async def get_lcia_methods(project_name: str):
     """
     if project_name not in bd.projects:
         raise HTTPException(status_code=404, detail="Project not found.")
-    if bd.projects.current != project_name:
-        bd.projects.set_current(project_name)
-    methods = [method[0] for method in bd.methods]
-    methods = list(set(methods))
+    headers = _project_etag_headers(project_name, "lcia_methods")
+    not_modified = _not_modified(request, response, headers)
+    if not_modified is not None:
+        return not_modified
+    with project_use(project_name):
+        methods = list(_get_methods_index(project_name).keys())
     return {"methods": methods}
 
 
 @app.get("/api/v1/project/{project_name}/lcia_methods/{lcia_method}/impact_categories")
-async def get_impact_categories(project_name: str, lcia_method: str):
+def get_impact_categories(
+    project_name: str, lcia_method: str, request: Request, response: Response
+):
     """
     Retrieve the list of impact categories for a given LCIA method.
 
@@ -386,16 +776,140 @@ async def get_impact_categories(project_name: str, lcia_method: str):
     """
     if project_name not in bd.projects:
         raise HTTPException(status_code=404, detail="Project not found.")
-    if bd.projects.current != project_name:
-        bd.projects.set_current(project_name)
-    impact_categories = [method[1] for method in bd.methods if lcia_method == method[0]]
+    headers = _project_etag_headers(project_name, "impact_categories", lcia_method)
+    not_modified = _not_modified(request, response, headers)
+    if not_modified is not None:
+        return not_modified
+    with project_use(project_name):
+        index = _get_methods_index(project_name)
+    impact_categories = [method[1] for method in index.get(lcia_method, [])]
     if not impact_categories:
         raise HTTPException(status_code=404, detail="LCIA method not found.")
 
     return {"impact_categories": impact_categories}
 
 
-def staticLCA(inputs: LCAInput) -> LCAResult:
+# (project, database, methods, data version) -> (lca, stacked C matrix).
+# Matrix assembly dominates small requests and only depends on this key, so
+# keep prepared LCA objects warm for half an hour. Each pool worker holds its
+# own copy; the project data version in the key retires worker entries the
+# moment an import bumps it, with the TTL as a backstop.
+_lca_cache = TTLCache(maxsize=8, ttl=1800)
+
+
+def _get_prepared_lca(
+    project_name: str,
+    database_name: str,
+    seed_demand: dict,
+    methods: list,
+    data_version: int = 0,
+) -> tuple:
+    """
+    Return a ready-to-solve LCA object and a stacked characterization matrix.
+
+    On a cache miss, builds the LCA from seed_demand (a (database, code)-
+    keyed dict, the only key shape bw2data accepts), runs lci once, and
+    collapses each method's characterization matrix (diagonal in bw2calc)
+    into one row of a (n_methods x n_biosphere) array, in methods order. On
+    a hit, none of that work is repeated; callers just re-solve with their
+    own demand. data_version is the caller's _project_versions counter, so
+    entries built before an import can never be served after it.
+    """
+    key = (project_name, database_name, tuple(methods), data_version)
+    try:
+        return _lca_cache[key]
+    except KeyError:
+        pass
+    lca = bc.LCA(demand=seed_demand, method=methods[0])
+    lca.lci()
+    # Cache the technosphere factorization so later demands are a cheap
+    # back-substitution instead of a full solve. decompose_technosphere is
+    # a no-op (and never sets lca.solver) when bw2calc picked pypardiso as
+    # its backend, so build the factorization ourselves in that case.
+    lca.decompose_technosphere()
+    if getattr(lca, "solver", None) is None:
+        lca.solver = factorized(lca.technosphere_matrix.tocsc())
+    rows = []
+    for method in methods:
+        lca.switch_method(method)
+        rows.append(np.asarray(lca.characterization_matrix.sum(axis=0)).ravel())
+    c_stack = np.vstack(rows)
+    _lca_cache[key] = (lca, c_stack)
+    return lca, c_stack
+
+
+def _solve_one(
+    project_name: str,
+    demand: dict,
+    methods: list,
+    act_cache: dict = None,
+    data_version: int = 0,
+) -> tuple:
+    """
+    Solve a single demand for all methods. Runs inside a pool worker.
+
+    Must stay a top-level function so it can be pickled for the process
+    pool. Returns (activity label, {method: score}); the label comes from
+    the demand's first activity. act_cache maps demand keys to resolved
+    activities so batches don't re-fetch shared activities. Callers must
+    hold project_use(project_name).
+    """
+    if act_cache is None:
+        act_cache = {key: bd.get_activity(key) for key in demand}
+    act = act_cache[next(iter(demand))]
+    # Seed with the (database, code)-keyed demand: bw2data's input
+    # preparation unpacks demand keys as tuples and chokes on plain
+    # integer ids. The vector below indexes by id instead.
+    lca, c_stack = _get_prepared_lca(
+        project_name, act["database"], demand, methods, data_version
+    )
+    # Solve against the cached factorization: build the demand vector, run
+    # the back-substitution, aggregate the inventory to one vector, then
+    # score every method with a single matrix-vector product.
+    demand_vector = np.zeros(lca.technosphere_matrix.shape[0])
+    for key, amount in demand.items():
+        try:
+            # Demands live in the product (row) dimension; bw2calc itself
+            # only allows demands on products, not activities.
+            demand_vector[lca.dicts.product[act_cache[key].id]] = amount
+        except KeyError:
+            raise ValueError(
+                f"Activity {key} is not a product in the technosphere matrix."
+            )
+    supply = lca.solver(demand_vector)
+    g = lca.biosphere_matrix @ supply
+    all_scores = c_stack @ g
+    scores = {method: float(score) for method, score in zip(methods, all_scores)}
+    return str(act), scores
+
+
+def _solve_chunk(
+    project_name: str, demands: list, methods: list, data_version: int = 0
+) -> dict:
+    """
+    Solve a batch of demands inside one pool worker.
+
+    Returns {activity label: {method: score}} for the batch; run_lca merges
+    the batches back together. data_version is the main process's
+    _project_versions counter for the project (workers have their own,
+    unbumped copy, so it has to travel with the task).
+    """
+    with project_use(project_name):
+        # Resolve each distinct activity once for the whole batch instead of
+        # once per demand.
+        act_cache = {
+            key: bd.get_activity(key) for demand in demands for key in demand
+        }
+        results = {}
+        for demand in demands:
+            act_label, scores = _solve_one(
+                project_name, demand, methods, act_cache, data_version
+            )
+            results[act_label] = scores
+    return results
+
+
+def staticLCA(inputs: LCAInput, project_name: str = None) -> LCAResult:
     """
     This method performs static LCA calculations for a list of demands and a list of methods.
     By static we mean that uncertainty distributions are not taken into account.
@@ -410,6 +924,9 @@ def staticLCA(inputs: LCAInput) -> LCAResult:
     methods : list
         A list of methods, where each method is a tuple of strings of the form:
         ("foo", "bar", "baz")
+    project_name : str, optional
+        The project to calculate in. Defaults to the current project; must be
+        passed explicitly when running inside a pool worker.
 
     Returns
     -------
@@ -440,33 +957,77 @@ def staticLCA(inputs: LCAInput) -> LCAResult:
         and isinstance(methods[0][0], str)
     ), "Methods must be a list of tuples of strings"
 
-    # Create all demands with a comprehension
-    all_demands = {k: 1 for demand in demands for k in demand}
-    # Initialize LCA object, the parameter use_distributions is false by default so no need to include it.
-    lca = bc.LCA(demand=all_demands, method=methods[0])
-    lca.lci()
+    # This runs inside a single pool worker (dispatched by run_lca), so the
+    # demands are solved serially here; with the cached factorization each
+    # solve is just a back-substitution.
+    if project_name is None:
+        project_name = bd.projects.current
+    results = _solve_chunk(
+        project_name, demands, methods, _project_versions[project_name]
+    )
+    # Guard the level so large result dicts are never formatted in production.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("staticLCA results: %s", results)
+    return convert_results_format(results)
 
-    # Create a dict of characterization matrices
-    C_matrices = {}
 
-    for method in methods:
-        lca.switch_method(method)
-        C_matrices[method] = lca.characterization_matrix.copy()
-
-    # Create container for results
-    results = {}
-    for demand in demands:
-        act = bd.get_activity(list(demand.keys())[0])
-        results[str(act)] = {method: None for method in methods}
-
-        # Convert to integer ids
-        int_demand = {act.id: value for _, value in demand.items()}
-        lca.lci(int_demand)
-        for method in methods:
-            lca.switch_method(method)
-            results[str(act)][method] = (C_matrices[method] * lca.inventory).sum()
-    print(results, "#" * 100)
-    return convert_results_format(results)
+def _validate_lca_request(
+    project_name: str, database_name: str, body: LCARequest
+) -> list:
+    """Validate an LCA request and resolve its impact categories.
+
+    Holds project access for the SQLite queries, so it must run in the
+    threadpool, not on the event loop: acquiring the guard can block
+    until readers of another project drain, and the batch query plus a
+    cold methods index are blocking work. Raises HTTPException on
+    unknown databases, activities, or methods.
+    """
+    with project_use(project_name):
+        if database_name not in bd.databases:
+            raise HTTPException(status_code=404, detail="Database not found.")
+
+        # Validate all demand codes with one query instead of one fetch per
+        # code.
+        codes = {key for demand in body.demands for key in demand}
+        found = {
+            row.code
+            for row in ActivityDataset.select(ActivityDataset.code).where(
+                ActivityDataset.code.in_(list(codes))
+                & (ActivityDataset.database == database_name)
+            )
+        }
+        missing = codes - found
+        if missing:
+            raise HTTPException(
+                status_code=404, detail=f"Activity {sorted(missing)[0]} not found."
+            )
+
+        impact_categories = []
+        if body.lcia_method:
+            impact_categories = _get_methods_index(project_name).get(
+                body.lcia_method, []
+            )
+            # An unknown method resolves to an empty list, which the pool
+            # workers can't solve; reject it here like an unknown category.
+            if not impact_categories:
+                raise HTTPException(
+                    status_code=404, detail="LCIA method not found."
+                )
+        elif body.impact_categories:
+            methods_set = _get_methods_set(project_name)
+            for method_list in body.impact_categories:
+                method_tuple = tuple(method_list)  # Convert list to tuple
+                if method_tuple not in methods_set:
+                    raise HTTPException(
+                        status_code=404, detail="Impact category not found."
+                    )
+                impact_categories.append(method_tuple)
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail="No impact categories provided or lcia method provided.",
+            )
+    return impact_categories
 
 
 @app.post("/api/v1/project/{project_name}/database/{database_name}/lca")
@@ -518,47 +1079,45 @@ async def run_lca(project_name: str, database_name: str, body: LCARequest):
 
     if project_name not in bd.projects:
         raise HTTPException(status_code=404, detail="Project not found.")
-    bd.projects.set_current(project_name)
-
-    if database_name not in bd.databases:
-        raise HTTPException(status_code=404, detail="Database not found.")
 
-    # Fetch the database
-    db = bd.Database(database_name)
-
-    for demand in body.demands:
-        for key in demand:
-            try:
-                db.get(key)
-            except:
-                raise HTTPException(
-                    status_code=404, detail=f"Activity {key} not found."
-                )
+    # The validation blocks (guard acquisition, SQLite), so run it in the
+    # threadpool to keep the event loop free for other requests.
+    impact_categories = await anyio.to_thread.run_sync(
+        _validate_lca_request, project_name, database_name, body
+    )
 
     demands = []
     for demand in body.demands:
         demands.append({(database_name, key): amount for key, amount in demand.items()})
 
-    impact_categories = []
-    if body.lcia_method:
-        impact_categories = [
-            method for method in bd.methods if body.lcia_method == method[0]
-        ]
-    elif body.impact_categories:
-        for method_list in body.impact_categories:
-            method_tuple = tuple(method_list)  # Convert list to tuple
-            if method_tuple not in bd.methods:
-                raise HTTPException(
-                    status_code=404, detail="Impact category not found."
+    # Perform the LCA calculations. The numeric solve is CPU-bound, so ship
+    # it to pool workers in chunks and gather the partial results;
+    # validation above stays here so errors return immediately.
+    try:
+        if process_pool is not None:
+            loop = asyncio.get_running_loop()
+            futures = [
+                loop.run_in_executor(
+                    process_pool,
+                    _solve_chunk,
+                    project_name,
+                    demands[start : start + _LCA_CHUNK_SIZE],
+                    impact_categories,
+                    _project_versions[project_name],
                 )
-            impact_categories.append(method_tuple)
-    else:
-        raise HTTPException(
-            status_code=400,
-            detail="No impact categories provided or lcia method provided.",
-        )
-
-    # Perform the LCA calculations
-    results = staticLCA(LCAInput(demands=demands, impact_categories=impact_categories))
+                for start in range(0, len(demands), _LCA_CHUNK_SIZE)
+            ]
+            raw_results = {}
+            for chunk_results in await asyncio.gather(*futures):
+                raw_results.update(chunk_results)
+            results = convert_results_format(raw_results)
+        else:
+            results = staticLCA(
+                LCAInput(demands=demands, impact_categories=impact_categories),
+                project_name,
+            )
+    except ValueError as e:
+        # e.g. a demand on an activity that is not a product in the matrix.
+        raise HTTPException(status_code=400, detail=str(e))
 
     return results
@@ -1,10 +1,16 @@
 def convert_results_format(
     results: dict[str, dict[tuple, float]]
 ) -> dict[str, dict[str, float]]:
+    # Every inner dict shares the same method tuples, so join each tuple to
+    # its string form once instead of once per demand.
+    joined = {}
     converted_results = {}
     for outer_key, inner_dict in results.items():
-        converted_inner_dict = {
-            " | ".join(key): value for key, value in inner_dict.items()
-        }
+        converted_inner_dict = {}
+        for key, value in inner_dict.items():
+            joined_key = joined.get(key)
+            if joined_key is None:
+                joined_key = joined[key] = " | ".join(key)
+            converted_inner_dict[joined_key] = value
         converted_results[outer_key] = converted_inner_dict
     return converted_results